@@ -0,0 +1,180 @@
+import json
+import lzma
+import os
+import re
+import struct
+import threading
+from typing import Dict, List, Optional, Tuple
+
+# Container layout:
+#   MAGIC | index length (8 bytes, big endian) | index JSON | compressed blobs
+# The index maps each month ("01".."12") to its file stem and the offset and
+# length of its compressed JSON and Markdown blobs.
+MAGIC = b"DAILYARCHIVE1\n"
+HEADER = struct.Struct(">Q")
+
+MONTH_STEM_PATTERN = re.compile(r"^(\d{4})_(0[1-9]|1[0-2])_[a-z]{3}$")
+
+# Archive path -> (mtime_ns, index, blob area offset)
+_index_cache: Dict[str, Tuple[int, Dict, int]] = {}
+_index_lock = threading.Lock()
+
+
+def get_archive_path(year_folder: str) -> str:
+    """
+    Return the archive container path for a year directory.
+    """
+    return os.path.join(year_folder, f"{os.path.basename(year_folder)}.archive")
+
+
+def write_archive(archive_path: str, months: Dict[str, Dict]) -> None:
+    """
+    Write a container for the given months.
+    months maps "MM" to {"stem": ..., "data": {...}, "markdown": "..."}.
+    """
+    index: Dict[str, Dict] = {}
+    blobs: List[bytes] = []
+    offset = 0
+
+    for month, month_data in sorted(months.items()):
+        lines = [
+            (json.dumps(day) + "\n").encode("utf-8")
+            for day in month_data["data"].get("entries", [])
+        ]
+
+        json_blob = lzma.compress(b"".join(lines))
+        md_blob = lzma.compress(month_data["markdown"].encode("utf-8"))
+        index[month] = {
+            "stem": month_data["stem"],
+            "json": [offset, len(json_blob)],
+            "md": [offset + len(json_blob), len(md_blob)],
+        }
+        blobs.extend([json_blob, md_blob])
+        offset += len(json_blob) + len(md_blob)
+
+    index_bytes = json.dumps({"compression": "lzma", "months": index}).encode("utf-8")
+    tmp_path = f"{archive_path}.tmp"
+    with open(tmp_path, "wb") as file:
+        file.write(MAGIC)
+        file.write(HEADER.pack(len(index_bytes)))
+        file.write(index_bytes)
+        for blob in blobs:
+            file.write(blob)
+    os.replace(tmp_path, archive_path)
+
+
+def read_archive_index(archive_path: str) -> Optional[Tuple[Dict, int]]:
+    """
+    Return (index, blob area offset) of an archive, or None if there is none.
+    The index is cached until the archive's mtime changes.
+    """
+    try:
+        mtime_ns = os.stat(archive_path).st_mtime_ns
+    except OSError:
+        return None
+
+    with _index_lock:
+        cached = _index_cache.get(archive_path)
+        if cached and cached[0] == mtime_ns:
+            return cached[1], cached[2]
+
+    with open(archive_path, "rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            print(f"ERROR: {archive_path} is not a daily archive.")
+            return None
+        (index_length,) = HEADER.unpack(file.read(HEADER.size))
+        index = json.loads(file.read(index_length))
+
+    blob_offset = len(MAGIC) + HEADER.size + index_length
+    with _index_lock:
+        _index_cache[archive_path] = (mtime_ns, index, blob_offset)
+    return index, blob_offset
+
+
+def archived_month_stems(year_folder: str) -> List[str]:
+    """
+    Return the file stems (e.g. "2025_01_jan") of the archived months of a year.
+    """
+    archive = read_archive_index(get_archive_path(year_folder))
+    if archive is None:
+        return []
+    return [month["stem"] for _, month in sorted(archive[0]["months"].items())]
+
+
+def _locate_month(month_path: str) -> Optional[Tuple[str, Dict, int]]:
+    """
+    Find the archive entry for a (missing) month file path.
+    """
+    year_folder = os.path.dirname(month_path)
+    stem = os.path.splitext(os.path.basename(month_path))[0]
+    match = MONTH_STEM_PATTERN.match(stem)
+    if not match:
+        return None
+
+    archive_path = get_archive_path(year_folder)
+    archive = read_archive_index(archive_path)
+    if archive is None:
+        return None
+    index, blob_offset = archive
+
+    month = index["months"].get(match.group(2))
+    if month is None or month["stem"] != stem:
+        return None
+    return archive_path, month, blob_offset
+
+
+def _read_blob(archive_path: str, blob_offset: int, span: List[int]) -> bytes:
+    with open(archive_path, "rb") as file:
+        file.seek(blob_offset + span[0])
+        return lzma.decompress(file.read(span[1]))
+
+
+def load_archived_json(json_path: str) -> Optional[Dict]:
+    """
+    Return the data of an archived month, or None if it is not archived.
+    Only that month's blob is read and decompressed.
+    """
+    located = _locate_month(json_path)
+    if located is None:
+        return None
+    archive_path, month, blob_offset = located
+
+    payload = _read_blob(archive_path, blob_offset, month["json"])
+    return {"entries": [json.loads(line) for line in payload.splitlines() if line]}
+
+
+def read_month_markdown(md_path: str) -> Optional[str]:
+    """
+    Return the text of a month's Markdown file, reading it from the year's
+    archive if the file itself has been archived.
+    """
+    if os.path.exists(md_path):
+        with open(md_path, "r") as file:
+            return file.read()
+
+    located = _locate_month(md_path)
+    if located is None:
+        return None
+    archive_path, month, blob_offset = located
+    return _read_blob(archive_path, blob_offset, month["md"]).decode("utf-8")
+
+
+def month_source_stat(month_path: str) -> os.stat_result:
+    """
+    Stat a month file, or the archive holding it if it has been archived.
+    """
+    try:
+        return os.stat(month_path)
+    except FileNotFoundError:
+        return os.stat(get_archive_path(os.path.dirname(month_path)))
+
+
+def is_month_archived(month_path: str) -> bool:
+    """
+    Return True if the month file only exists inside its year's archive.
+    """
+    return not os.path.exists(month_path) and _locate_month(month_path) is not None
+
+
+def is_year_archived(year_folder: str) -> bool:
+    return os.path.exists(get_archive_path(year_folder))
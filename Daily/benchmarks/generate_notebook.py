@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+
+################################################################################
+# generate_notebook.py
+#
+# Description:
+#   Build a synthetic ~/Notes/Daily style tree (YYYY/YYYY_MM_mon.{json,md})
+#   for benchmarking. The notebook ends at the current month so the commands
+#   that work on "this month" have data to chew on.
+#
+# Usage:
+#   python benchmarks/generate_notebook.py BASE_DIR [OPTIONS]
+#
+# Options:
+#   --years N              Number of years of history (default: 1).
+#   --tasks-per-day N      Average number of tasks per day (default: 4).
+#   --tags SPEC            Tag weights, e.g. "work:5,home:3,errand:1".
+#   --note-words N         Average number of words per note (default: 40).
+#   --seed N               Random seed (default: 0).
+#
+################################################################################
+
+import argparse
+import calendar
+import os
+import random
+import sys
+from datetime import date, datetime, timedelta
+from typing import Dict, List
+
+DEFAULT_TAGS = {"work": 5, "home": 3, "errand": 2, "health": 1, "UNTAGGED": 1}
+
+WORDS = (
+    "call email fix write read plan review clean buy book check draft send "
+    "update sort file pay order cook walk test ship refactor debug garden "
+    "report invoice meeting groceries dentist budget backup laptop project"
+).split()
+
+
+def parse_tag_spec(spec: str) -> Dict[str, int]:
+    """
+    Parse a "tag:weight,tag:weight" string into a dictionary.
+    """
+    tags = {}
+    for item in spec.split(","):
+        name, _, weight = item.partition(":")
+        tags[name.strip()] = int(weight) if weight else 1
+    return tags
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generate a synthetic notebook.")
+    parser.add_argument("base_dir", help="Directory to write the notebook into")
+    parser.add_argument("--years", type=int, default=1)
+    parser.add_argument("--tasks-per-day", type=int, default=4)
+    parser.add_argument("--tags", type=parse_tag_spec, default=DEFAULT_TAGS)
+    parser.add_argument("--note-words", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args()
+
+
+# BASE_DIR is fixed when the Daily modules are imported, so point it at the
+# target first (as run_benchmarks.py does) to keep the real notebook untouched.
+if __name__ == "__main__":
+    ARGS = parse_arguments()
+    os.environ["DAILY_BASE_DIR"] = os.path.expanduser(ARGS.base_dir)
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from json_handler import save_json  # noqa: E402
+from parsing import write_markdown  # noqa: E402
+
+
+def make_day(
+    rng: random.Random,
+    day: date,
+    tasks_per_day: int,
+    tags: Dict[str, int],
+    note_words: int,
+) -> Dict:
+    """
+    Build one day's entry with random tasks and a note.
+    """
+    tag_names = list(tags)
+    tag_weights = list(tags.values())
+    tasks: List[Dict] = []
+
+    for _ in range(max(0, int(rng.gauss(tasks_per_day, tasks_per_day / 3)))):
+        started = day - timedelta(days=rng.randint(0, min(day.day - 1, 10)))
+        task = {
+            "name": " ".join(rng.choices(WORDS, k=rng.randint(2, 8))),
+            "completed": rng.random() < 0.8,
+            "started_date": started.isoformat(),
+            "tag": rng.choices(tag_names, tag_weights)[0],
+        }
+        if task["completed"]:
+            task["completed_date"] = day.strftime("%Y-%m-%d %a")
+        tasks.append(task)
+
+    notes = ""
+    if rng.random() < 0.7:
+        word_count = max(1, int(rng.expovariate(1 / note_words)))
+        notes = " ".join(rng.choices(WORDS, k=word_count))
+
+    return {"date": day.strftime("%Y-%m-%d %a"), "tasks": tasks, "notes": notes}
+
+
+def generate_notebook(
+    base_dir: str,
+    years: int = 1,
+    tasks_per_day: int = 4,
+    tags: Dict[str, int] = None,
+    note_words: int = 40,
+    seed: int = 0,
+) -> int:
+    """
+    Write a synthetic notebook under base_dir and return the number of month files.
+    """
+    rng = random.Random(seed)
+    tags = tags or DEFAULT_TAGS
+    today = datetime.now().date()
+    month_count = 0
+
+    for year in range(today.year - years + 1, today.year + 1):
+        last_month = today.month if year == today.year else 12
+        year_folder = os.path.join(base_dir, str(year))
+        os.makedirs(year_folder, exist_ok=True)
+
+        for month in range(1, last_month + 1):
+            days_in_month = calendar.monthrange(year, month)[1]
+            if year == today.year and month == today.month:
+                days_in_month = today.day
+            entries = [
+                make_day(rng, date(year, month, d), tasks_per_day, tags, note_words)
+                for d in range(1, days_in_month + 1)
+            ]
+            data = {"entries": entries}
+
+            month_name = calendar.month_abbr[month].lower()
+            stem = os.path.join(year_folder, f"{year}_{month:02d}_{month_name}")
+            save_json(f"{stem}.json", data, with_notes=True)
+            write_markdown(f"{stem}.md", data)
+            month_count += 1
+
+    return month_count
+
+
+if __name__ == "__main__":
+    count = generate_notebook(
+        os.path.expanduser(ARGS.base_dir),
+        ARGS.years,
+        ARGS.tasks_per_day,
+        ARGS.tags,
+        ARGS.note_words,
+        ARGS.seed,
+    )
+    print(f"Generated {count} month files in {ARGS.base_dir}.")
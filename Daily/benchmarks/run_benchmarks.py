@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+
+################################################################################
+# run_benchmarks.py
+#
+# Description:
+#   Time the Daily commands and getters against synthetic notebooks of
+#   different sizes, save the results as JSON and compare them against a
+#   saved baseline.
+#
+# Usage:
+#   python benchmarks/run_benchmarks.py [OPTIONS]
+#
+# Options:
+#   --years N [N ...]      Notebook sizes in years (default: 1 10 50).
+#   --tasks-per-day N      Average number of tasks per day (default: 4).
+#   --repeat N             Timed runs per benchmark (default: 5).
+#   --output FILE          Where to write the results (default: bench_results.json).
+#   --baseline FILE        Compare against this results file.
+#   --threshold RATIO      Slowdown ratio that counts as a regression (default: 1.25).
+#
+# Notes:
+#   - Each notebook is generated in a temporary directory which is used as
+#     BASE_DIR through the DAILY_BASE_DIR environment variable.
+#   - Commands that modify files have the year folders of the current and
+#     previous month restored before every run, so every run (and every later
+#     benchmark) starts from the same data.
+#   - parse_markdown, load_json, load_json_notes and the getters start from
+#     an empty parsed-file cache, so they time real parsing; the *_cached
+#     entries time the same calls on a warm cache.
+#   - Bash completion of `daily -lt <TAB>` must stay under 20ms.
+#   - Exits with status 1 if completion is over budget or any benchmark
+#     regressed past the threshold.
+#
+################################################################################
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Dict, List
+
+BENCH_ROOT = tempfile.mkdtemp(prefix="daily_bench_")
+os.environ["DAILY_BASE_DIR"] = BENCH_ROOT
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from completion import get_completion_script  # noqa: E402
+from date_paths import (  # noqa: E402
+    get_current_year,
+    get_file_path,
+    get_json_file_path,
+    get_prev_json_file_path,
+)
+from export import export_notes  # noqa: E402
+from file_cache import clear_cache  # noqa: E402
+from generate_notebook import generate_notebook  # noqa: E402
+from json_handler import load_json, read_json  # noqa: E402
+from parsing import parse_markdown, read_markdown, write_markdown  # noqa: E402
+from sync import sync_year  # noqa: E402
+from tasks_core import check_off_task, move_unchecked  # noqa: E402
+from tasks_getters import (  # noqa: E402
+    get_completed_tasks,
+    get_tags,
+    get_tasks_by_tag,
+    get_unfinished_tasks,
+)
+
+# Shell completion has to feel instant on every keystroke.
+COMPLETION_BUDGET_MS = 20
+
+
+def snapshot_files(paths: List[str]) -> Dict[str, bytes]:
+    """
+    Read the given files so they can be restored after a modifying command.
+    """
+    snapshot = {}
+    for path in paths:
+        if path and os.path.exists(path):
+            with open(path, "rb") as file:
+                snapshot[path] = file.read()
+    return snapshot
+
+
+def restore_files(snapshot: Dict[str, bytes]) -> None:
+    """
+    Write the snapshotted files back.
+    """
+    for path, content in snapshot.items():
+        with open(path, "wb") as file:
+            file.write(content)
+
+
+def time_call(
+    func: Callable, repeat: int, setup: Callable = None
+) -> Dict[str, float]:
+    """
+    Run func repeat times (calling setup untimed before each run) and
+    return the min and median wall time in milliseconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - start) * 1000)
+    return {
+        "min_ms": round(min(timings), 3),
+        "median_ms": round(statistics.median(timings), 3),
+    }
+
+
+def time_completion(repeat: int) -> Dict[str, float]:
+    """
+    Time a full bash completion of `daily -lt <TAB>`, including starting bash.
+    """
+    script = get_completion_script("bash") + (
+        "COMP_WORDS=(daily -lt ''); COMP_CWORD=2; _daily_complete\n"
+    )
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(["bash", "-c", script], check=True)
+        timings.append((time.perf_counter() - start) * 1000)
+    return {
+        "min_ms": round(min(timings), 3),
+        "median_ms": round(statistics.median(timings), 3),
+    }
+
+
+def run_suite(repeat: int) -> Dict[str, Dict[str, float]]:
+    """
+    Time every command and getter against the notebook in BENCH_ROOT.
+    """
+    md_path = get_file_path()
+    json_path = get_json_file_path()
+    prev_json_path = get_prev_json_file_path()
+    scratch_md = os.path.join(BENCH_ROOT, "scratch.md")
+    data = load_json(json_path, with_notes=True)
+
+    # sync_year rewrites every month of the year and -u the previous month,
+    # so keep a copy of every file in the year folders they can touch.
+    touched_folders = {os.path.dirname(json_path)}
+    if prev_json_path:
+        touched_folders.add(os.path.dirname(prev_json_path))
+    snapshot = snapshot_files(
+        [
+            os.path.join(folder, name)
+            for folder in touched_folders
+            for name in os.listdir(folder)
+        ]
+    )
+
+    def restore():
+        restore_files(snapshot)
+
+    benchmarks = {
+        "read_markdown": (lambda: read_markdown(md_path), None),
+        "parse_markdown": (lambda: parse_markdown(md_path), clear_cache),
+        "parse_markdown_cached": (lambda: parse_markdown(md_path), None),
+        "write_markdown": (lambda: write_markdown(scratch_md, data), None),
+        "read_json": (lambda: read_json(json_path), None),
+        "load_json": (lambda: load_json(json_path), clear_cache),
+        "load_json_cached": (lambda: load_json(json_path), None),
+        "load_json_notes": (lambda: load_json(json_path, with_notes=True), clear_cache),
+        "load_json_notes_cached": (
+            lambda: load_json(json_path, with_notes=True),
+            None,
+        ),
+        "check_off_task": (lambda: check_off_task(1), restore),
+        "move_unchecked": (lambda: move_unchecked(), restore),
+        "sync_year": (lambda: sync_year(int(get_current_year())), restore),
+        "get_unfinished_tasks": (lambda: get_unfinished_tasks(), clear_cache),
+        "get_unfinished_tasks_cached": (lambda: get_unfinished_tasks(), None),
+        "get_completed_tasks": (lambda: get_completed_tasks(json_path), clear_cache),
+        "get_completed_tasks_cached": (lambda: get_completed_tasks(json_path), None),
+        "get_tasks_by_tag": (
+            lambda: get_tasks_by_tag(json_path, "work"),
+            clear_cache,
+        ),
+        "get_tasks_by_tag_cached": (
+            lambda: get_tasks_by_tag(json_path, "work"),
+            None,
+        ),
+        "get_tags": (lambda: get_tags(json_path), clear_cache),
+        "get_tags_cached": (lambda: get_tags(json_path), None),
+        "export_jsonl": (lambda: export_notes("jsonl", output=io.StringIO()), None),
+    }
+
+    results = {}
+    for name, (func, setup) in benchmarks.items():
+        results[name] = time_call(func, repeat, setup)
+    restore()
+    results["completion_bash"] = time_completion(repeat)
+    return results
+
+
+def compare_results(
+    results: Dict[str, Dict], baseline: Dict[str, Dict], threshold: float
+) -> List[str]:
+    """
+    Return a line for every benchmark whose median is slower than the
+    baseline median by more than threshold.
+    """
+    regressions = []
+    for size, benchmarks in results.items():
+        for name, timing in benchmarks.items():
+            base = baseline.get(size, {}).get(name)
+            if not base or not base["median_ms"]:
+                continue
+            ratio = timing["median_ms"] / base["median_ms"]
+            if ratio > threshold:
+                regressions.append(
+                    f"{size:<5} {name:<28} {base['median_ms']:>10.2f}ms -> "
+                    f"{timing['median_ms']:>10.2f}ms  (x{ratio:.2f})"
+                )
+    return regressions
+
+
+def print_results(results: Dict[str, Dict]) -> None:
+    """
+    Print the median timing of every benchmark for every notebook size.
+    """
+    sizes = list(results)
+    print(f"\n{'benchmark':<28}" + "".join(f"{size:>12}" for size in sizes))
+    for name in results[sizes[0]]:
+        row = "".join(f"{results[size][name]['median_ms']:>10.2f}ms" for size in sizes)
+        print(f"{name:<28}{row}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the Daily commands.")
+    parser.add_argument("--years", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--tasks-per-day", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--baseline", help="Results file to compare against")
+    parser.add_argument("--threshold", type=float, default=1.25)
+    args = parser.parse_args()
+
+    results = {}
+    try:
+        for years in args.years:
+            for entry in os.listdir(BENCH_ROOT):
+                shutil.rmtree(os.path.join(BENCH_ROOT, entry), ignore_errors=True)
+            generate_notebook(BENCH_ROOT, years, args.tasks_per_day)
+            results[f"{years}y"] = run_suite(args.repeat)
+    finally:
+        shutil.rmtree(BENCH_ROOT, ignore_errors=True)
+
+    print_results(results)
+
+    with open(args.output, "w") as file:
+        json.dump(
+            {
+                "created": datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "tasks_per_day": args.tasks_per_day,
+                "results": results,
+            },
+            file,
+            indent=4,
+        )
+    print(f"\nResults saved to {args.output}")
+
+    slow_completions = [
+        f"{size:<5} {timings['completion_bash']['median_ms']:.2f}ms"
+        for size, timings in results.items()
+        if timings["completion_bash"]["median_ms"] > COMPLETION_BUDGET_MS
+    ]
+    if slow_completions:
+        print(f"\nCompletion slower than {COMPLETION_BUDGET_MS}ms:\n")
+        print("\n".join(slow_completions))
+        sys.exit(1)
+
+    if args.baseline:
+        with open(args.baseline, "r") as file:
+            baseline = json.load(file)["results"]
+        regressions = compare_results(results, baseline, args.threshold)
+        if regressions:
+            print(f"\nRegressions (slower than x{args.threshold}):\n")
+            print("\n".join(regressions))
+            sys.exit(1)
+        print("\nNo regressions against the baseline.")
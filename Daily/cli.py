@@ -1,6 +1,31 @@
 import argparse
 from datetime import datetime
 
+from date_paths import get_now
+
+
+def iso_date(value: str) -> str:
+    """
+    Argparse type for a "YYYY-MM-DD" date, returned zero-padded.
+    """
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").strftime("%Y-%m-%d")
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date `{value}`, use YYYY-MM-DD")
+
+
+def positive_int(value: str) -> int:
+    """
+    Argparse type for a whole number greater than zero.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive number, got `{value}`")
+    return number
+
 
 def parse_arguments():
     """
@@ -56,18 +81,75 @@ def parse_arguments():
         action="store_true",
         help="Move unchecked tasks to the most recent day",
     )
+    parser.add_argument(
+        "--export",
+        choices=["csv", "jsonl"],
+        help="Export all tasks and notes to stdout as CSV or JSONL",
+    )
+    parser.add_argument(
+        "--from",
+        dest="date_from",
+        type=iso_date,
+        help="Only export entries on or after this date (YYYY-MM-DD)",
+    )
+    parser.add_argument(
+        "--to",
+        dest="date_to",
+        type=iso_date,
+        help="Only export entries on or before this date (YYYY-MM-DD)",
+    )
+    parser.add_argument(
+        "--grep",
+        type=str,
+        metavar="PATTERN",
+        help="Search all tasks and notes for a pattern, newest first",
+    )
+    parser.add_argument(
+        "--limit",
+        type=positive_int,
+        help="Stop --grep after this many matches",
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Show cycle times, weekly throughput and open task ages",
+    )
+    parser.add_argument(
+        "--chart",
+        type=str,
+        metavar="FILE",
+        help="Also save --stats as a PNG chart",
+    )
+    parser.add_argument(
+        "--archive",
+        type=int,
+        metavar="YEAR",
+        help="Pack a finished year into a single compressed archive",
+    )
+    parser.add_argument(
+        "--completion",
+        choices=["bash", "zsh"],
+        help="Print the shell completion script for bash or zsh",
+    )
+    parser.add_argument(
+        "--notebook",
+        action="append",
+        metavar="NAME",
+        help="Run -l, -lt, -ltags, --grep or --stats across these notebooks "
+        "(repeat the option, or use 'all')",
+    )
     parser.add_argument(
         "-s",
         "--sync",
         type=int,
         nargs="?",
-        default=datetime.now().year,
+        default=get_now().year,
         help="Sync all Markdown files for the given year (default: current year).",
     )
 
     args = parser.parse_args()
 
     if args.sync is None:
-        args.sync = datetime.now().year
+        args.sync = get_now().year
 
     return args
@@ -0,0 +1,160 @@
+import os
+from typing import Dict, List
+
+from date_paths import BASE_DIR, NOTEBOOKS_CONFIG, get_notebooks, get_now
+
+# Tiny tab-separated file the shell completion reads instead of importing
+# the app: a "month<TAB>YYYY-MM" line followed by "tag<TAB>NAME",
+# "task<TAB>NUMBER<TAB>NAME", "date<TAB>DATE" and "notebook<TAB>NAME" lines.
+# The scripts ignore the month's tags, tasks and dates in a cache written in
+# an earlier month.
+COMPLETION_CACHE_PATH = os.path.join(BASE_DIR, ".completion")
+
+OPTIONS = [
+    "-c",
+    "-e",
+    "-l",
+    "-lc",
+    "-lt",
+    "-ltags",
+    "-n",
+    "-o",
+    "-t",
+    "-u",
+    "-s",
+    "--export",
+    "--from",
+    "--to",
+    "--grep",
+    "--limit",
+    "--stats",
+    "--chart",
+    "--archive",
+    "--completion",
+    "--notebook",
+]
+
+BASH_SCRIPT = r"""# daily bash completion, load with: source <(daily --completion bash)
+_daily_complete() {
+    local cur="${COMP_WORDS[COMP_CWORD]}" prev="${COMP_WORDS[COMP_CWORD-1]}"
+    local cache="__CACHE__" kind key value rest now words=()
+
+    case "$prev" in
+        -lt|--list-tag) kind=tag ;;
+        -c|--check) kind=task ;;
+        --from|--to) kind=date ;;
+        --notebook) kind=notebook; words=(all) ;;
+        --export) COMPREPLY=($(compgen -W "csv jsonl" -- "$cur")); return ;;
+        --completion) COMPREPLY=($(compgen -W "bash zsh" -- "$cur")); return ;;
+        *) COMPREPLY=($(compgen -W "__OPTIONS__" -- "$cur")); return ;;
+    esac
+
+    [[ -r "$cache" ]] || return
+    printf -v now '%(%Y-%m)T' -1 2>/dev/null || now=$(date +%Y-%m)
+    while IFS=$'\t' read -r key value rest; do
+        [[ "$key" == month && "$value" != "$now" && "$kind" != notebook ]] && return
+        [[ "$key" == "$kind" ]] && words+=("$value")
+    done < "$cache"
+    COMPREPLY=($(compgen -W "${words[*]}" -- "$cur"))
+}
+complete -F _daily_complete daily day
+"""
+
+ZSH_SCRIPT = r"""# daily zsh completion, load with: source <(daily --completion zsh)
+_daily_complete() {
+    local cache="__CACHE__" kind line key value name now=${(%):-%D{%Y-%m}}
+    local -a values descriptions
+
+    case "${words[CURRENT-1]}" in
+        -lt|--list-tag) kind=tag ;;
+        -c|--check) kind=task ;;
+        --from|--to) kind=date ;;
+        --notebook) kind=notebook; values=(all); descriptions=(all) ;;
+        --export) compadd csv jsonl; return ;;
+        --completion) compadd bash zsh; return ;;
+        *) compadd -- __OPTIONS__; return ;;
+    esac
+
+    [[ -r "$cache" ]] || return
+    for line in "${(@f)$(<$cache)}"; do
+        key="${line%%$'\t'*}"
+        value="${${line#*$'\t'}%%$'\t'*}"
+        [[ "$key" == month && "$value" != "$now" && "$kind" != notebook ]] && return
+        [[ "$key" == "$kind" ]] || continue
+        name="${line#*$'\t'*$'\t'}"
+        values+=("$value")
+        if [[ "$kind" == task ]]; then
+            descriptions+=("$value -- $name")
+        else
+            descriptions+=("$value")
+        fi
+    done
+    compadd -l -d descriptions -a values
+}
+compdef _daily_complete daily day
+"""
+
+
+def update_completion_cache(data: Dict[str, List[Dict]]) -> None:
+    """
+    Rewrite the completion cache from the current month's data.
+    Task numbers follow the same order as the -l listing.
+    """
+    entries = data.get("entries", [])
+    tags = set()
+    lines = [f"month\t{get_now():%Y-%m}"]
+    task_count = 1
+
+    for day in entries:
+        lines.append(f"date\t{day['date'][:10]}")
+        for task in day.get("tasks", []):
+            if task.get("tag"):
+                tags.add(task["tag"])
+            if not task["completed"]:
+                name = " ".join(task["name"].split())[:45]
+                lines.append(f"task\t{task_count}\t{name}")
+                task_count += 1
+
+    lines.extend(f"tag\t{tag}" for tag in sorted(tags))
+    lines.extend(f"notebook\t{name}" for name in get_notebooks())
+
+    tmp_path = f"{COMPLETION_CACHE_PATH}.tmp"
+    try:
+        with open(tmp_path, "w") as file:
+            file.write("\n".join(lines) + "\n")
+        os.replace(tmp_path, COMPLETION_CACHE_PATH)
+    except OSError as e:
+        print(f"Warning: Could not update completion cache: {e}")
+
+
+def completion_cache_is_stale() -> bool:
+    """
+    Return True if the completion cache is missing, was written in an
+    earlier month or is older than the notebooks config.
+    """
+    try:
+        with open(COMPLETION_CACHE_PATH, "r") as file:
+            key, _, value = file.readline().rstrip("\n").partition("\t")
+            cache_mtime = os.fstat(file.fileno()).st_mtime
+    except OSError:
+        return True
+    if key != "month" or value != f"{get_now():%Y-%m}":
+        return True
+    try:
+        return os.stat(NOTEBOOKS_CONFIG).st_mtime > cache_mtime
+    except OSError:
+        return False
+
+
+def get_completion_script(shell: str) -> str:
+    """
+    Return the completion script for bash or zsh.
+    """
+    script = BASH_SCRIPT if shell == "bash" else ZSH_SCRIPT
+    return script.replace("__CACHE__", COMPLETION_CACHE_PATH).replace(
+        "__OPTIONS__", " ".join(OPTIONS)
+    )
+
+
+def print_completion_script(shell: str) -> None:
+    print(get_completion_script(shell), end="")
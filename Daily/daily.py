@@ -23,11 +23,25 @@
 #   -o, --open               Open the current month's markdown file in a rendered markdown viewer.
 #   -t, --task               Add a new task to today's section.
 #   -u, --update             Move all unchecked tasks from the current and previous month to today.
+#   --export FORMAT          Stream all tasks and notes as csv or jsonl to stdout.
+#   --from DATE, --to DATE   Limit --export to an inclusive YYYY-MM-DD date range.
+#   --grep PATTERN           Search every month's tasks and notes, newest first.
+#   --limit N                Stop --grep after N matches.
+#   --stats [--chart FILE]   Show task cycle times, throughput and open task ages.
+#   --archive YEAR           Pack a finished year into one compressed archive file.
+#   --completion SHELL       Print the bash or zsh completion script.
+#   --notebook NAME          Run -l, -lt, -ltags, --grep and --stats across the named
+#                            notebooks (repeatable, "all" for every notebook).
 #   -s, --sync [YEAR]        Sync all Markdown files for the given year into JSON.
 #                            If no year is provided, it defaults to the current year.
 #
 # Notes:
 #   - Tasks are stored in JSON files under "~/Notes/Daily/YYYY/YYYY_MM_mon.json".
+#   - Named notebooks are configured in "~/.config/daily/notebooks.json" as
+#     {"name": "base directory"}. Commands write to the first one, or to the one
+#     named by the DAILY_NOTEBOOK environment variable.
+#   - --notebook queries skip a notebook that takes longer than 5 seconds;
+#     DAILY_NOTEBOOK_TIMEOUT sets another limit (0 waits for every notebook).
 #   - Each month's data is stored separately, with tasks and notes organized by date.
 #   - Tasks are listed under "### Tasks" and notes under "### Notes" in Markdown format.
 #   - Tasks include metadata: name, completion status, tag, and start date.
@@ -37,12 +51,23 @@
 #
 ################################################################################
 
-from datetime import datetime
 
 from cli import parse_arguments
-from date_paths import get_file_path, get_json_file_path
+from completion import print_completion_script
+from date_paths import get_file_path, get_json_file_path, get_now
 from editor import open_file_in_vim, open_file_in_browser
-from sync import sync_year
+from export import export_notes
+from json_handler import refresh_completion_cache
+from notebooks import (
+    print_notebooks_grep_results,
+    print_notebooks_stats,
+    print_notebooks_tags,
+    print_notebooks_tasks_by_tag,
+    print_notebooks_unfinished_tasks,
+)
+from search import print_grep_results
+from stats import print_stats
+from sync import archive_year, sync_year
 from tasks_core import check_off_task, move_unchecked, prompt_for_note, prompt_for_task
 from tasks_printers import (
     print_completed_tasks,
@@ -69,13 +94,34 @@ if __name__ == "__main__":
         "open": lambda: open_file_in_browser(file_path),
         "task": lambda: prompt_for_task(),
         "update": lambda: move_unchecked(),
+        "export": lambda: export_notes(args.export, args.date_from, args.date_to),
+        "grep": lambda: print_grep_results(args.grep, args.limit),
+        "stats": lambda: print_stats(args.chart),
+        "archive": lambda: archive_year(args.archive),
+        "completion": lambda: print_completion_script(args.completion),
         "sync": lambda: sync_year(args.sync),
     }
 
+    if args.notebook:
+        COMMANDS.update(
+            {
+                "list": lambda: print_notebooks_unfinished_tasks(args.notebook),
+                "list_tag": lambda: print_notebooks_tasks_by_tag(
+                    args.notebook, args.list_tag
+                ),
+                "list_tags": lambda: print_notebooks_tags(args.notebook),
+                "grep": lambda: print_notebooks_grep_results(
+                    args.notebook, args.grep, args.limit
+                ),
+                "stats": lambda: print_notebooks_stats(args.notebook, args.chart),
+            }
+        )
+
     args = parse_arguments()
+    refresh_completion_cache()
 
     # Ensure sync only runs if explicitly requested
-    if args.sync is not None and args.sync != datetime.now().year:
+    if args.sync is not None and args.sync != get_now().year:
         sync_year(args.sync)
     else:
         # Run the first argument that is set
@@ -1,38 +1,104 @@
 import calendar
+import json
 import os
+import re
+import threading
 from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from archive import archived_month_stems, is_month_archived
+
+DEFAULT_BASE_DIR = "~/Notes/Daily"
+
+# Named notebooks, e.g. {"personal": "~/Notes/Daily", "work": "~/Work/Daily"}
+NOTEBOOKS_CONFIG = os.path.expanduser(
+    os.environ.get("DAILY_NOTEBOOKS_CONFIG", "~/.config/daily/notebooks.json")
+)
+
+
+def get_notebooks() -> Dict[str, str]:
+    """
+    Return the configured notebooks as {name: base directory}.
+    Without a config file there is a single "default" notebook.
+    """
+    notebooks = {}
+    if os.path.exists(NOTEBOOKS_CONFIG):
+        try:
+            with open(NOTEBOOKS_CONFIG, "r") as file:
+                notebooks = json.load(file)
+        except json.JSONDecodeError:
+            print(f"ERROR: Invalid JSON format in {NOTEBOOKS_CONFIG}. Ignoring it.")
+
+    if not isinstance(notebooks, dict) or not notebooks:
+        notebooks = {"default": DEFAULT_BASE_DIR}
+    return {name: os.path.expanduser(path) for name, path in notebooks.items()}
+
+
+def get_base_dir() -> str:
+    """
+    Return the notebook directory commands write to.
+    DAILY_BASE_DIR wins (e.g. for benchmarks), then the notebook named by
+    DAILY_NOTEBOOK, then the first configured notebook.
+    """
+    if os.environ.get("DAILY_BASE_DIR"):
+        return os.path.expanduser(os.environ["DAILY_BASE_DIR"])
+
+    notebooks = get_notebooks()
+    name = os.environ.get("DAILY_NOTEBOOK")
+    if name and name not in notebooks:
+        print(f"Warning: Unknown notebook `{name}`, using the default one.")
+    return notebooks.get(name) or next(iter(notebooks.values()))
+
 
 # Base directory for notes
-BASE_DIR = os.path.expanduser("~/Notes/Daily")
+BASE_DIR = get_base_dir()
+
+MONTH_FILE_PATTERN = re.compile(r"^(\d{4})_(0[1-9]|1[0-2])_[a-z]{3}(\..+)$")
+
+# Clock snapshot shared by every helper so one command sees a single "now".
+_now: Optional[datetime] = None
+
+# Directory path -> (mtime_ns, sorted entry names)
+_listing_cache: Dict[str, Tuple[int, List[str]]] = {}
+_listing_lock = threading.Lock()
+
+
+def get_now() -> datetime:
+    """
+    Return the time the current command started.
+    """
+    global _now
+    if _now is None:
+        _now = datetime.now()
+    return _now
 
 
 def get_current_date():
-    return datetime.now().strftime("%Y-%m-%d")
+    return get_now().strftime("%Y-%m-%d")
 
 
 def get_current_date_day():
-    return datetime.now().strftime("%Y-%m-%d %a")
+    return get_now().strftime("%Y-%m-%d %a")
 
 
 def get_current_year():
-    return datetime.now().strftime("%Y")
+    return get_now().strftime("%Y")
 
 
 def get_current_month():
-    return datetime.now().strftime("%m")
+    return get_now().strftime("%m")
 
 
 def get_current_month_name():
-    return datetime.now().strftime("%b").lower()
+    return get_now().strftime("%b").lower()
 
 
-def get_prev_month_name() -> str:
-    current_month = datetime.now().month  # Get the current month as an int
-    if current_month == 1:  # If January, go to December
-        prev_month = 12
-    else:
-        prev_month = current_month - 1
-    return calendar.month_abbr[prev_month].lower()
+def shift_month(year: int, month: int, delta: int) -> Tuple[int, int]:
+    """
+    Return the (year, month) that is delta months away from the given one.
+    """
+    index = year * 12 + (month - 1) + delta
+    return index // 12, index % 12 + 1
 
 
 def get_current_year_dir():
@@ -43,45 +109,124 @@ def get_current_year_dir():
 os.makedirs(os.path.join(BASE_DIR, get_current_year()), exist_ok=True)
 
 
-# Paths for storing notes and tasks
-def get_file_path():
-    year = get_current_year()
+def get_month_file_path(
+    year: int, month: int, extension: str, base_dir: str = None
+) -> str:
+    """
+    Return the path of a month file, e.g. BASE_DIR/2025/2025_01_jan.json.
+    """
+    month_name = calendar.month_abbr[month].lower()
     return os.path.join(
-        BASE_DIR,
-        year,
-        f"{year}_{get_current_month()}_{get_current_month_name()}.md",
+        base_dir or BASE_DIR, str(year), f"{year}_{month:02d}_{month_name}{extension}"
     )
 
 
-def get_json_file_path():
-    year = get_current_year()
-    return os.path.join(
-        BASE_DIR,
-        year,
-        f"{year}_{get_current_month()}_{get_current_month_name()}.json",
-    )
+# Paths for storing notes and tasks
+def get_file_path():
+    now = get_now()
+    return get_month_file_path(now.year, now.month, ".md")
+
+
+def get_json_file_path(base_dir: str = None):
+    now = get_now()
+    return get_month_file_path(now.year, now.month, ".json", base_dir)
 
 
 def get_prev_json_file_path() -> str:
     """
-    Return the previous month's JSON file path if it exists.
+    Return the previous month's JSON file path if it exists, either as a
+    file or packed into its year's archive.
     """
-    current_year = int(get_current_year())
-    current_month = int(get_current_month())
+    now = get_now()
+    prev_year, prev_month = shift_month(now.year, now.month, -1)
+    prev_json_path = get_month_file_path(prev_year, prev_month, ".json")
 
-    if current_month == 1:  # If January, go to December of the previous year
-        prev_year = current_year - 1
-        prev_month = 12
-    else:
-        prev_year = current_year
-        prev_month = current_month - 1
+    if os.path.exists(prev_json_path) or is_month_archived(prev_json_path):
+        return prev_json_path
+    return None
 
-    prev_month_name = get_prev_month_name()
 
-    prev_json_path = os.path.join(
-        BASE_DIR,
-        str(prev_year),
-        f"{prev_year}_{str(prev_month).zfill(2)}_{prev_month_name}.json",
-    )
+def list_dir_cached(path: str) -> List[str]:
+    """
+    Return the sorted entries of a directory.
+    The listing is reused for as long as the directory's mtime is unchanged,
+    so repeated range queries cost a stat instead of a scan.
+    """
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return []
 
-    return prev_json_path if os.path.exists(prev_json_path) else None
+    with _listing_lock:
+        cached = _listing_cache.get(path)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+
+    try:
+        names = sorted(os.listdir(path))
+    except OSError:
+        return []
+
+    with _listing_lock:
+        _listing_cache[path] = (mtime_ns, names)
+    return names
+
+
+def get_month_paths(
+    extension: str, start: str = None, end: str = None, base_dir: str = None
+) -> list:
+    """
+    Return existing month file paths with the given extension in date order.
+    Months packed into a year archive are listed under their original paths.
+    start and end are inclusive "YYYY-MM" (or longer) bounds; either may be None.
+    base_dir selects another notebook than BASE_DIR.
+    """
+    base_dir = base_dir or BASE_DIR
+    start_key = start[:7] if start else None
+    end_key = end[:7] if end else None
+    paths = []
+
+    for year in list_dir_cached(base_dir):
+        if not year.isdigit():
+            continue
+        if (start_key and year < start_key[:4]) or (end_key and year > end_key[:4]):
+            continue
+
+        year_folder = os.path.join(base_dir, year)
+        names = list_dir_cached(year_folder)
+        if f"{year}.archive" in names:
+            names = sorted(
+                set(names)
+                | {stem + extension for stem in archived_month_stems(year_folder)}
+            )
+
+        for name in names:
+            match = MONTH_FILE_PATTERN.match(name)
+            if not match or match.group(3) != extension:
+                continue
+            month_key = f"{match.group(1)}-{match.group(2)}"
+            if start_key and month_key < start_key:
+                continue
+            if end_key and month_key > end_key:
+                continue
+            paths.append(os.path.join(year_folder, name))
+
+    return paths
+
+
+def get_month_json_paths(
+    start: str = None, end: str = None, base_dir: str = None
+) -> list:
+    """
+    Return existing month JSON file paths in date order.
+    """
+    return get_month_paths(".json", start, end, base_dir)
+
+
+def get_month_md_paths(
+    start: str = None, end: str = None, base_dir: str = None
+) -> list:
+    """
+    Return existing month Markdown file paths in date order.
+    """
+    return get_month_paths(".md", start, end, base_dir)
@@ -0,0 +1,124 @@
+import csv
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional
+
+from date_paths import get_month_json_paths
+from json_handler import load_json
+
+EXPORT_FIELDS = [
+    "date",
+    "kind",
+    "name",
+    "tag",
+    "completed",
+    "started_date",
+    "completed_date",
+    "text",
+]
+
+# Number of month files loaded ahead of the writer.
+PREFETCH_MONTHS = 4
+
+
+def iter_month_data(paths: List[str]) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the decoded data of each month file in the given order.
+    A small thread pool reads the next months while the current one is
+    written out. The threads only overlap file reads and archive
+    decompression; JSON decoding holds the GIL and still runs one at a time.
+    Only a bounded number of months are held in memory at once.
+    """
+    with ThreadPoolExecutor(max_workers=PREFETCH_MONTHS) as executor:
+        pending: deque = deque()
+        path_iter = iter(paths)
+
+        for path in path_iter:
+            pending.append(executor.submit(load_json, path, True))
+            if len(pending) >= PREFETCH_MONTHS:
+                break
+
+        while pending:
+            data = pending.popleft().result()
+            next_path = next(path_iter, None)
+            if next_path is not None:
+                pending.append(executor.submit(load_json, next_path, True))
+            yield data
+
+
+def iter_export_rows(
+    date_from: Optional[str] = None, date_to: Optional[str] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield one row per task and one row per day's notes, in date order.
+    date_from and date_to are inclusive "YYYY-MM-DD" bounds.
+    """
+    paths = get_month_json_paths(date_from, date_to)
+
+    for data in iter_month_data(paths):
+        for day in data.get("entries", []):
+            day_key = day["date"][:10]
+            if date_from and day_key < date_from[:10]:
+                continue
+            if date_to and day_key > date_to[:10]:
+                continue
+
+            for task in day.get("tasks", []):
+                yield {
+                    "date": day["date"],
+                    "kind": "task",
+                    "name": task["name"],
+                    "tag": task.get("tag", ""),
+                    "completed": task["completed"],
+                    "started_date": task.get("started_date", ""),
+                    "completed_date": task.get("completed_date", ""),
+                    "text": "",
+                }
+
+            if day.get("notes"):
+                yield {
+                    "date": day["date"],
+                    "kind": "note",
+                    "name": "",
+                    "tag": "",
+                    "completed": "",
+                    "started_date": "",
+                    "completed_date": "",
+                    "text": day["notes"],
+                }
+
+
+def export_notes(
+    export_format: str,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    output=None,
+) -> None:
+    """
+    Stream all tasks and notes to output (stdout by default) as CSV or JSONL.
+    Stops quietly when the reader goes away, e.g. `day --export csv | head`.
+    """
+    output = output or sys.stdout
+    rows = iter_export_rows(date_from, date_to)
+
+    try:
+        if export_format == "csv":
+            writer = csv.DictWriter(output, fieldnames=EXPORT_FIELDS)
+            writer.writeheader()
+            for row in rows:
+                writer.writerow(row)
+        elif export_format == "jsonl":
+            for row in rows:
+                output.write(json.dumps(row) + "\n")
+        else:
+            print(f"Unknown export format: {export_format}")
+        output.flush()
+    except BrokenPipeError:
+        if output is sys.stdout:
+            # Point stdout at devnull so the flush at exit does not fail again
+            devnull = os.open(os.devnull, os.O_WRONLY)
+            os.dup2(devnull, sys.stdout.fileno())
+            sys.exit(1)
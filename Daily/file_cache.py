@@ -0,0 +1,186 @@
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Set, Tuple
+
+from archive import month_source_stat
+from date_paths import BASE_DIR, MONTH_FILE_PATTERN
+
+# Parsed files are kept pickled so every hit hands out a fresh copy that the
+# caller is free to modify. On disk every month file gets its own small cache
+# file under its notebook's .cache/parsed, named "<kind>.<file name>.pickle",
+# so a command only reads and writes the entries it touches.
+CACHE_DIR_NAME = os.path.join(".cache", "parsed")
+MEMORY_ENTRIES = 256
+DISK_ENTRIES = 4096  # Per notebook
+
+# (kind, path) -> ((mtime_ns, size), pickled value)
+CacheKey = Tuple[str, str]
+FileKey = Tuple[int, int]
+_memory: "OrderedDict[CacheKey, Tuple[FileKey, bytes]]" = OrderedDict()
+_lock = threading.Lock()
+
+# Cache directories already pruned by this process
+_pruned: Set[str] = set()
+
+
+def _file_key(path: str) -> Optional[FileKey]:
+    """
+    Return (mtime_ns, size) of a file, or of the archive holding it.
+    """
+    try:
+        stat = month_source_stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _disk_path(cache_key: CacheKey) -> Optional[str]:
+    """
+    Return the cache file of a month file inside its notebook, or None for
+    files that are not month files (those are only cached in memory).
+    """
+    kind, path = cache_key
+    year_folder, name = os.path.split(path)
+    base_dir, year = os.path.split(year_folder)
+    if not year.isdigit() or not MONTH_FILE_PATTERN.match(name):
+        return None
+    return os.path.join(base_dir, CACHE_DIR_NAME, f"{kind}.{name}.pickle")
+
+
+def prune_disk_cache(cache_dir: str) -> None:
+    """
+    Once a notebook's cache holds more than DISK_ENTRIES files, delete the
+    entries whose month file is gone, then the least recently used ones.
+    """
+    try:
+        names = os.listdir(cache_dir)
+    except OSError:
+        return
+    if len(names) <= DISK_ENTRIES:
+        return
+
+    base_dir = os.path.dirname(os.path.dirname(cache_dir))
+    entries = []
+    for name in names:
+        if name.endswith(".tmp"):  # A write in progress
+            continue
+        path = os.path.join(cache_dir, name)
+        source_name = name[: -len(".pickle")].partition(".")[2]
+        source = os.path.join(base_dir, source_name[:4], source_name)
+        try:
+            if (
+                not name.endswith(".pickle")
+                or not MONTH_FILE_PATTERN.match(source_name)
+                or _file_key(source) is None
+            ):
+                os.remove(path)
+                continue
+            entries.append((os.stat(path).st_mtime_ns, path))
+        except OSError:
+            continue
+
+    entries.sort()
+    for _, path in entries[: max(0, len(entries) - DISK_ENTRIES)]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def _read_disk_entry(cache_key: CacheKey) -> Optional[Tuple[FileKey, bytes]]:
+    disk_path = _disk_path(cache_key)
+    if disk_path is None:
+        return None
+    try:
+        with open(disk_path, "rb") as file:
+            entry = pickle.load(file)
+        os.utime(disk_path)  # Mark it as recently used
+        return entry
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        return None
+
+
+def _write_disk_entry(cache_key: CacheKey, entry: Tuple[FileKey, bytes]) -> None:
+    disk_path = _disk_path(cache_key)
+    if disk_path is None:
+        return
+    cache_dir = os.path.dirname(disk_path)
+    if cache_dir not in _pruned:
+        _pruned.add(cache_dir)
+        prune_disk_cache(cache_dir)
+
+    tmp_path = f"{disk_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(tmp_path, "wb") as file:
+            pickle.dump(entry, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, disk_path)
+    except OSError as e:
+        print(f"Warning: Could not save parsed file cache: {e}")
+
+
+def _remember(cache_key: CacheKey, entry: Tuple[FileKey, bytes]) -> None:
+    """
+    Store a pickled value in memory, evicting the least recently used.
+    """
+    with _lock:
+        _memory[cache_key] = entry
+        _memory.move_to_end(cache_key)
+        while len(_memory) > MEMORY_ENTRIES:
+            _memory.popitem(last=False)
+
+
+def cached_parse(kind: str, path: str, parse: Callable[[str], Any]) -> Any:
+    """
+    Return parse(path), reusing an earlier result while the file's mtime
+    and size are unchanged. kind separates different parsers of one file.
+    """
+    file_key = _file_key(path)
+    if file_key is None:
+        return parse(path)
+
+    cache_key = (kind, os.path.abspath(path))
+    with _lock:
+        entry = _memory.get(cache_key)
+    if entry is None or entry[0] != file_key:
+        entry = _read_disk_entry(cache_key)
+    if entry is not None and entry[0] == file_key:
+        _remember(cache_key, entry)
+        return pickle.loads(entry[1])
+
+    value = parse(path)
+    entry = (file_key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    _remember(cache_key, entry)
+    _write_disk_entry(cache_key, entry)
+    return value
+
+
+def prime_cache(kind: str, path: str, value: Any) -> None:
+    """
+    Record value as the parsed content of a file that was just written,
+    so the next read of it is a cache hit.
+    """
+    file_key = _file_key(path)
+    if file_key is None:
+        return
+    cache_key = (kind, os.path.abspath(path))
+    entry = (file_key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    _remember(cache_key, entry)
+    _write_disk_entry(cache_key, entry)
+
+
+def clear_cache(base_dir: Optional[str] = None) -> None:
+    """
+    Forget every cached parse, in memory and in a notebook's cache on disk.
+    """
+    with _lock:
+        _memory.clear()
+    cache_dir = os.path.join(base_dir or BASE_DIR, CACHE_DIR_NAME)
+    if os.path.isdir(cache_dir):
+        for name in os.listdir(cache_dir):
+            try:
+                os.remove(os.path.join(cache_dir, name))
+            except OSError:
+                pass
@@ -1,15 +1,57 @@
 import json
 import os
+from collections import defaultdict
+from typing import Dict, List
 
+from archive import load_archived_json
+from completion import completion_cache_is_stale, update_completion_cache
+from date_paths import get_json_file_path
+from file_cache import cached_parse, prime_cache
 
-def load_json(file_path: str) -> dict:
+
+def get_notes_path(file_path: str) -> str:
     """
-    Load a JSON file and return its content as a dictionary.
-    If the file doesn't exist or is invalid, return an empty dictionary.
+    Return the path of the notes file that belongs to a month JSON file.
+    Notes are stored one record per line, e.g. 2025_01_jan.notes.jsonl.
     """
-    if not os.path.exists(file_path):
-        return {"entries": []}
+    return file_path.replace(".json", ".notes.jsonl")
+
+
+def read_notes(notes_path: str) -> Dict[str, List[str]]:
+    """
+    Read a notes file, grouping the notes by day.
+    """
+    notes: Dict[str, List[str]] = defaultdict(list)
+
+    with open(notes_path, "r") as file:
+        for line in file:
+            if not line.strip():
+                continue
+            try:
+                note = json.loads(line)
+            except json.JSONDecodeError:
+                print(f"ERROR: Invalid note record in {notes_path}. Skipping it.")
+                continue
+            notes[note["date"]].append(note["text"])
+
+    return notes
+
+
+def load_notes(file_path: str) -> Dict[str, List[str]]:
+    """
+    Load the notes of a month JSON file, grouped by day.
+    """
+    notes_path = get_notes_path(file_path)
+    if not os.path.exists(notes_path):
+        return defaultdict(list)
+    return cached_parse("notes", notes_path, read_notes)
 
+
+def read_json(file_path: str) -> dict:
+    """
+    Read and decode a JSON file.
+    If the file is invalid, return an empty dictionary.
+    """
     try:
         with open(file_path, "r") as file:
             data = json.load(file)
@@ -19,9 +61,113 @@ def load_json(file_path: str) -> dict:
         return {"entries": []}
 
 
-def save_json(file_path: str, data: dict) -> None:
+def load_json(file_path: str, with_notes: bool = False) -> dict:
+    """
+    Load a JSON file and return its content as a dictionary.
+    Notes are only read from the month's notes file when with_notes is set.
+    Months that have been archived are read from their year's archive.
+    Decoded files are cached until they change (see file_cache).
+    If the file doesn't exist or is invalid, return an empty dictionary.
+    """
+    if not os.path.exists(file_path):
+        return load_archived_json(file_path) or {"entries": []}
+
+    data = cached_parse("json", file_path, read_json)
+
+    if with_notes and os.path.exists(get_notes_path(file_path)):
+        notes = load_notes(file_path)
+        entries = data.setdefault("entries", [])
+        for day in entries:
+            # Notes not yet moved out of an old JSON file come first
+            texts = [day["notes"]] if day.get("notes") else []
+            texts += [text for text in notes.pop(day["date"], []) if text not in texts]
+            day["notes"] = "\n\n".join(texts)
+        for date, texts in notes.items():  # Notes for a day with no JSON entry
+            index = next(
+                (i for i, day in enumerate(entries) if day["date"] > date), len(entries)
+            )
+            entries.insert(
+                index, {"date": date, "tasks": [], "notes": "\n\n".join(texts)}
+            )
+
+    return data
+
+
+def has_inline_notes(file_path: str) -> bool:
+    """
+    Return True if a month JSON file still stores notes inline.
+    """
+    if not os.path.exists(file_path):
+        return False
+    return any(day.get("notes") for day in load_json(file_path).get("entries", []))
+
+
+def write_notes(file_path: str, data: dict) -> None:
+    """
+    Rewrite the notes file of a month from the notes in data.
+    """
+    notes_path = get_notes_path(file_path)
+    with open(notes_path, "w") as file:
+        for day in data.get("entries", []):
+            if day.get("notes"):
+                file.write(json.dumps({"date": day["date"], "text": day["notes"]}))
+                file.write("\n")
+
+
+def append_note(file_path: str, date: str, text: str) -> None:
+    """
+    Append a single note record to the notes file of a month.
+    """
+    with open(get_notes_path(file_path), "a") as file:
+        file.write(json.dumps({"date": date, "text": text}) + "\n")
+
+
+def move_inline_notes(file_path: str) -> None:
+    """
+    Append the notes still stored inline in a month JSON file to its notes
+    file, skipping any that are already there.
+    """
+    stored_notes = load_notes(file_path)
+    for day in load_json(file_path).get("entries", []):
+        if day.get("notes") and day["notes"] not in stored_notes[day["date"]]:
+            append_note(file_path, day["date"], day["notes"])
+
+
+def save_json(file_path: str, data: dict, with_notes: bool = False) -> None:
     """
     Save structured data to a JSON file.
+    Notes never go into the JSON file itself. With with_notes set, the
+    notes file is rewritten from data; otherwise it is left alone, except
+    that notes still stored inline in the old JSON file are moved out first.
+    Saving the current month also refreshes the shell completion cache.
     """
+    entries = data.get("entries", [])
+
+    if with_notes:
+        write_notes(file_path, data)
+    elif has_inline_notes(file_path):
+        move_inline_notes(file_path)
+
+    tasks_data = dict(data)
+    tasks_data["entries"] = [
+        {key: value for key, value in day.items() if key != "notes"} for day in entries
+    ]
     with open(file_path, "w") as file:
-        json.dump(data, file, indent=4)
+        json.dump(tasks_data, file, indent=4)
+    prime_cache("json", file_path, tasks_data)
+
+    if os.path.abspath(file_path) == os.path.abspath(get_json_file_path()):
+        update_completion_cache(data)
+
+
+def refresh_completion_cache() -> None:
+    """
+    Rebuild the completion cache if it is missing, from an earlier month or
+    older than the notebooks config, so task numbers are not offered from
+    last month after a rollover.
+    """
+    if not completion_cache_is_stale():
+        return
+    json_path = get_json_file_path()
+    data = load_json(json_path) if os.path.exists(json_path) else {"entries": []}
+    update_completion_cache(data)
@@ -0,0 +1,229 @@
+import os
+import queue
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional
+
+from date_paths import get_json_file_path, get_notebooks
+from search import compile_pattern, grep_notes
+from stats import load_task_columns, merge_task_columns, print_stats, require_numpy
+from tasks_getters import get_tags, get_tasks_by_tag, get_unfinished_tasks
+
+# Seconds to wait for a notebook before reporting results without it.
+# DAILY_NOTEBOOK_TIMEOUT overrides it; 0 waits for every notebook.
+DEFAULT_NOTEBOOK_TIMEOUT = 5.0
+
+
+def get_notebook_timeout() -> float:
+    """
+    Return the notebook timeout from DAILY_NOTEBOOK_TIMEOUT or the default.
+    """
+    value = os.environ.get("DAILY_NOTEBOOK_TIMEOUT")
+    if not value:
+        return DEFAULT_NOTEBOOK_TIMEOUT
+    try:
+        return float(value)
+    except ValueError:
+        print(f"Warning: Invalid DAILY_NOTEBOOK_TIMEOUT `{value}`, using the default.")
+        return DEFAULT_NOTEBOOK_TIMEOUT
+
+
+def select_notebooks(names: List[str]) -> Dict[str, str]:
+    """
+    Return {name: base directory} for the requested notebooks.
+    "all" selects every configured notebook.
+    """
+    notebooks = get_notebooks()
+    if "all" in names:
+        return notebooks
+
+    selected = {}
+    for name in names:
+        if name in notebooks:
+            selected[name] = notebooks[name]
+        else:
+            known = ", ".join(notebooks)
+            print(f"Warning: Unknown notebook `{name}`. Known notebooks: {known}")
+    return selected
+
+
+def fan_out(
+    func: Callable[[str], Any],
+    notebooks: Dict[str, str],
+    timeout: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Run func(base_dir) for every notebook, each on its own daemon thread.
+    Notebooks that fail or take longer than timeout seconds (by default
+    get_notebook_timeout()) are reported and left out. Their threads are
+    daemons, so one slow disk neither holds back the others nor keeps the
+    command from exiting.
+    """
+    if timeout is None:
+        timeout = get_notebook_timeout()
+    answers: queue.Queue = queue.Queue()
+
+    def run(name: str, base_dir: str) -> None:
+        try:
+            answers.put((name, func(base_dir), None))
+        except Exception as e:
+            answers.put((name, None, e))
+
+    for name, base_dir in notebooks.items():
+        threading.Thread(target=run, args=(name, base_dir), daemon=True).start()
+
+    deadline = time.monotonic() + timeout if timeout > 0 else None
+    pending = set(notebooks)
+    results = {}
+    while pending:
+        remaining = None if deadline is None else deadline - time.monotonic()
+        if remaining is not None and remaining <= 0:
+            break
+        try:
+            name, result, error = answers.get(timeout=remaining)
+        except queue.Empty:
+            break
+        pending.discard(name)
+        if error is not None:
+            print(f"Warning: Notebook `{name}` failed: {error}")
+        else:
+            results[name] = result
+
+    for name in notebooks:
+        if name in pending:
+            print(
+                f"Warning: Notebook `{name}` did not answer within {timeout:g}s, "
+                "skipping it. Set DAILY_NOTEBOOK_TIMEOUT to wait longer."
+            )
+
+    return {name: results[name] for name in notebooks if name in results}
+
+
+def print_notebooks_unfinished_tasks(names: List[str]) -> None:
+    """
+    Print the unfinished tasks of several notebooks, oldest first.
+    Task numbers are per notebook, as used by -c inside that notebook.
+    """
+    results = fan_out(
+        lambda base_dir: get_unfinished_tasks(get_json_file_path(base_dir)),
+        select_notebooks(names),
+    )
+    tasks = sorted(
+        (
+            (started_date, notebook, task_count, tag, short_name)
+            for notebook, notebook_tasks in results.items()
+            for task_count, tag, short_name, started_date in notebook_tasks
+        ),
+        key=lambda task: task[0],
+    )
+
+    print("\n                           All Unfinished Tasks\n")
+    if not tasks:
+        print("No unfinished tasks.")
+        return
+    for started_date, notebook, task_count, tag, short_name in tasks:
+        print(
+            f"{notebook:<10}  {task_count:<3}  {tag:<10}  "
+            f"{short_name:<48}  {started_date}"
+        )
+
+
+def print_notebooks_tasks_by_tag(names: List[str], tag: str) -> None:
+    """
+    Print the tasks with the given tag from several notebooks in date order.
+    """
+    results = fan_out(
+        lambda base_dir: get_tasks_by_tag(get_json_file_path(base_dir), tag),
+        select_notebooks(names),
+    )
+    days = sorted(
+        (
+            (day["date"], notebook, task)
+            for notebook, tagged_tasks in results.items()
+            for day in tagged_tasks
+            for task in day["tasks"]
+        ),
+        key=lambda item: item[0],
+    )
+    if not days:
+        print(f"No tasks found with tag `{tag}`.")
+        return
+
+    output = [f"\nTasks with tag `{tag}`:\n"]
+    for date, notebook, task in days:
+        status = "[x]" if task["completed"] else "[ ]"
+        output.append(f"- {status} {task['name']} ({date}) [{notebook}]")
+    print("\n".join(output))
+
+
+def print_notebooks_tags(names: List[str]) -> None:
+    """
+    Print the tags of several notebooks with their combined counts.
+    """
+    results = fan_out(
+        lambda base_dir: get_tags(get_json_file_path(base_dir)),
+        select_notebooks(names),
+    )
+    tag_counts: Dict[str, int] = defaultdict(int)
+    for tags in results.values():
+        for tag, count in tags.items():
+            tag_counts[tag] += count
+
+    if tag_counts:
+        print("\nTags in use:\n")
+        pad_char = "."
+        for tag, count in sorted(tag_counts.items()):
+            print(f"{tag:{pad_char}<16} {count}")
+    else:
+        print("No tags found.")
+
+
+def print_notebooks_grep_results(
+    names: List[str], pattern: str, limit: Optional[int] = None
+) -> None:
+    """
+    Search several notebooks concurrently and print the hits newest first.
+    """
+    regex = compile_pattern(pattern)
+    if regex is None:
+        return
+    results = fan_out(
+        lambda base_dir: grep_notes(regex, limit, base_dir),
+        select_notebooks(names),
+    )
+
+    hits = sorted(
+        (
+            (date, notebook, section, line)
+            for notebook, notebook_hits in results.items()
+            for date, section, line in notebook_hits
+        ),
+        key=lambda hit: hit[0][:10],
+        reverse=True,
+    )
+    if limit:
+        hits = hits[:limit]
+
+    if not hits:
+        print(f"No matches found for `{pattern}`.")
+        return
+
+    output = [f"\nMatches for `{pattern}`:\n"]
+    for date, notebook, section, line in hits:
+        output.append(f"{date:<16}  {notebook:<10}  {section:<4}  {line}")
+    print("\n".join(output))
+
+
+def print_notebooks_stats(names: List[str], chart_file: Optional[str] = None) -> None:
+    """
+    Print task statistics over the combined history of several notebooks.
+    """
+    if not require_numpy():
+        return
+
+    results = fan_out(load_task_columns, select_notebooks(names))
+    if not results:
+        print("No tasks found.")
+        return
+    print_stats(chart_file, merge_task_columns(list(results.values())))
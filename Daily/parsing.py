@@ -2,10 +2,23 @@ import os
 import re
 from typing import List, Dict, Any, Optional
 
+from file_cache import cached_parse
+
 
 def parse_markdown(file_path: str) -> Dict[str, List[Dict[str, Any]]]:
     """
     Parse the markdown file, extracting tasks with tags and started dates.
+    The result is cached until the file changes (see file_cache).
+    """
+    if not os.path.exists(file_path):
+        return {"entries": []}
+
+    return cached_parse("markdown", file_path, read_markdown)
+
+
+def read_markdown(file_path: str) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Read and parse a markdown file without going through the cache.
     """
     data: List[Dict[str, Any]] = []
     current_day: Optional[Dict[str, Any]] = None
@@ -119,6 +132,6 @@ def write_markdown(file_path: str, data: Dict[str, List[Dict]]) -> None:
 
                 file.write("\n")
 
-            if day["notes"]:
+            if day.get("notes"):
                 file.write("### Notes\n\n")
                 file.write(f"{day['notes']}\n\n")
@@ -0,0 +1,133 @@
+import re
+import threading
+from typing import List, Optional, Tuple
+
+from archive import read_month_markdown
+from date_paths import get_month_md_paths
+
+# Number of month files searched concurrently.
+SEARCH_WORKERS = 8
+
+# (day header, section, line) where section is "task" or "note"
+Hit = Tuple[str, str, str]
+
+
+def search_month_file(
+    file_path: str, pattern: re.Pattern, stop: threading.Event
+) -> List[Hit]:
+    """
+    Search a single Markdown month file, newest day first.
+    Sections are recognised the same way parse_markdown does it.
+    """
+    days: List[List[Hit]] = []
+    current_date: Optional[str] = None
+    in_notes_section = False
+    in_tasks_section = False
+
+    if stop.is_set():
+        return []
+
+    try:
+        text = read_month_markdown(file_path)
+    except OSError:
+        return []
+
+    for line in (text or "").splitlines():
+        line = line.rstrip()
+
+        if line.startswith("## "):  # Date header
+            current_date = line[3:]
+            days.append([])
+            in_notes_section = False
+            in_tasks_section = False
+        elif current_date is not None:
+            if line.startswith("### Tasks"):
+                in_notes_section = False
+                in_tasks_section = True
+            elif line.startswith("### Notes"):
+                in_tasks_section = False
+                in_notes_section = True
+            elif in_tasks_section:
+                if line.startswith("- [ ]") or line.startswith("- [x]"):
+                    if pattern.search(line):
+                        days[-1].append((current_date, "task", line))
+            elif in_notes_section and line and pattern.search(line):
+                days[-1].append((current_date, "note", line))
+
+    return [hit for day in reversed(days) for hit in day]
+
+
+def compile_pattern(pattern: str) -> Optional[re.Pattern]:
+    """
+    Compile a case-insensitive search pattern, or explain why it is invalid.
+    """
+    try:
+        return re.compile(pattern, re.IGNORECASE)
+    except re.error as e:
+        print(f"Invalid pattern `{pattern}`: {e}")
+        return None
+
+
+def grep_notes(
+    regex: re.Pattern, limit: Optional[int] = None, base_dir: Optional[str] = None
+) -> List[Hit]:
+    """
+    Search all month files newest first, stopping once limit hits are found.
+    Workers are daemon threads that stay at most SEARCH_WORKERS files ahead
+    of the results, so a search left running on a slow disk (see
+    notebooks.fan_out) does not keep the command from exiting.
+    """
+    paths = list(reversed(get_month_md_paths(base_dir=base_dir)))
+    stop = threading.Event()
+    window = threading.Semaphore(SEARCH_WORKERS)
+    next_index = iter(range(len(paths)))
+    index_lock = threading.Lock()
+    results: List[List[Hit]] = [[] for _ in paths]
+    finished = [threading.Event() for _ in paths]
+
+    def worker() -> None:
+        while True:
+            window.acquire()
+            with index_lock:
+                index = next(next_index, None)
+            if index is None or stop.is_set():
+                return
+            try:
+                results[index] = search_month_file(paths[index], regex, stop)
+            finally:
+                finished[index].set()
+
+    for _ in range(min(SEARCH_WORKERS, len(paths))):
+        threading.Thread(target=worker, daemon=True).start()
+
+    hits: List[Hit] = []
+    for index in range(len(paths)):
+        finished[index].wait()
+        hits.extend(results[index])
+        if limit and len(hits) >= limit:
+            break
+        window.release()
+    stop.set()
+    for _ in range(SEARCH_WORKERS):
+        window.release()
+
+    return hits[:limit] if limit else hits
+
+
+def print_grep_results(pattern: str, limit: Optional[int] = None) -> None:
+    """
+    Print every line matching the pattern with its day and section.
+    """
+    regex = compile_pattern(pattern)
+    if regex is None:
+        return
+    hits = grep_notes(regex, limit)
+
+    if not hits:
+        print(f"No matches found for `{pattern}`.")
+        return
+
+    output = [f"\nMatches for `{pattern}`:\n"]
+    for date, section, line in hits:
+        output.append(f"{date:<16}  {section:<4}  {line}")
+    print("\n".join(output))
@@ -0,0 +1,241 @@
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from date_paths import get_month_json_paths, get_now
+from file_cache import cached_parse
+from json_handler import load_json
+
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed for --stats
+    np = None
+
+CYCLE_PERCENTILES = [50, 75, 90]
+AGE_BUCKETS = [0, 8, 31, 91, 366]
+AGE_LABELS = ["0-7d", "8-30d", "31-90d", "91-365d", ">1y"]
+THROUGHPUT_WEEKS = 12
+
+COLUMNS = ["name", "tag", "started", "completed", "completed_date"]
+
+
+def valid_date(value: Optional[str]) -> str:
+    """
+    Return the "YYYY-MM-DD" part of value, or "NaT" if it is not a real date
+    (e.g. a hand-edited "(13-45)" or a header that is not a date).
+    """
+    try:
+        return datetime.strptime((value or "")[:10], "%Y-%m-%d").strftime("%Y-%m-%d")
+    except ValueError:
+        return "NaT"
+
+
+def extract_month_columns(json_path: str) -> Dict[str, list]:
+    """
+    Flatten a month's tasks into plain column lists.
+    Dates are "YYYY-MM-DD" strings, with "NaT" where a date is missing or
+    invalid. Tasks without a valid start date are left out.
+    """
+    columns: Dict[str, list] = {name: [] for name in COLUMNS}
+
+    for day in load_json(json_path).get("entries", []):
+        for task in day.get("tasks", []):
+            started = valid_date(task.get("started_date") or day["date"])
+            if started == "NaT":
+                continue
+            completed = bool(task.get("completed"))
+            completed_date = "NaT"
+            if completed:
+                completed_date = valid_date(task.get("completed_date") or day["date"])
+
+            columns["name"].append(task.get("name", ""))
+            columns["tag"].append(task.get("tag") or "UNTAGGED")
+            columns["started"].append(started)
+            columns["completed"].append(completed)
+            columns["completed_date"].append(completed_date)
+
+    return columns
+
+
+def load_task_columns(base_dir: Optional[str] = None) -> Dict[str, "np.ndarray"]:
+    """
+    Return the task columns of every month of a notebook as NumPy arrays.
+    Each month's columns are cached (see file_cache) and only re-extracted
+    when the file changes.
+    """
+    merged: Dict[str, list] = {name: [] for name in COLUMNS}
+
+    for json_path in get_month_json_paths(base_dir=base_dir):
+        columns = cached_parse("stats_columns", json_path, extract_month_columns)
+        for name in COLUMNS:
+            merged[name].extend(columns[name])
+
+    return {
+        "name": np.array(merged["name"], dtype=str),
+        "tag": np.array(merged["tag"], dtype=str),
+        "started": np.array(merged["started"], dtype="datetime64[D]"),
+        "completed": np.array(merged["completed"], dtype=bool),
+        "completed_date": np.array(merged["completed_date"], dtype="datetime64[D]"),
+    }
+
+
+def cycle_time_percentiles(columns: Dict[str, "np.ndarray"]) -> Dict[str, list]:
+    """
+    Return [count, p50, p75, p90] of the cycle time in days for each tag.
+    """
+    done = columns["completed"] & ~np.isnat(columns["completed_date"])
+    tags = columns["tag"][done]
+    cycle_days = columns["completed_date"][done] - columns["started"][done]
+    cycle_days = np.maximum(cycle_days.astype(int), 0)
+
+    order = np.argsort(tags, kind="stable")
+    unique_tags, starts = np.unique(tags[order], return_index=True)
+    groups = np.split(cycle_days[order], starts[1:])
+
+    return {
+        tag: [len(group)] + np.percentile(group, CYCLE_PERCENTILES).tolist()
+        for tag, group in zip(unique_tags.tolist(), groups)
+        if len(group)
+    }
+
+
+def week_start(dates: "np.ndarray") -> "np.ndarray":
+    """
+    Return the Monday of the week each date falls in.
+    """
+    # datetime64 weeks start on Thursday (the epoch), so shift by three days.
+    monday = np.timedelta64(3, "D")
+    return (dates + monday).astype("datetime64[W]").astype("datetime64[D]") - monday
+
+
+def weekly_throughput(
+    columns: Dict[str, "np.ndarray"], today: "np.datetime64", weeks: int
+) -> Dict[str, int]:
+    """
+    Return the number of completed tasks per week (Monday start) for the
+    last given number of weeks.
+    """
+    done_dates = columns["completed_date"][~np.isnat(columns["completed_date"])]
+    this_monday = week_start(today)
+
+    weeks_ago = (this_monday - week_start(done_dates)).astype(int) // 7
+    recent = weeks_ago[(weeks_ago >= 0) & (weeks_ago < weeks)]
+    counts = np.bincount(weeks - 1 - recent, minlength=weeks)
+
+    week_offsets = np.arange(weeks - 1, -1, -1) * np.timedelta64(7, "D")
+    all_weeks = this_monday - week_offsets
+    return {str(week): int(count) for week, count in zip(all_weeks, counts)}
+
+
+def open_task_ages(
+    columns: Dict[str, "np.ndarray"], today: "np.datetime64"
+) -> Dict[str, int]:
+    """
+    Return the number of open tasks in each age bucket.
+    -u copies open tasks forward but leaves the old copy unchecked, so a task
+    counts as open only if no copy of its (tag, name, started) key was
+    completed, and then only once.
+    """
+    keys = np.char.add(
+        np.char.add(columns["tag"], "\x1f"),
+        np.char.add(columns["name"], "\x1f"),
+    )
+    keys = np.char.add(keys, columns["started"].astype(str))
+
+    open_mask = ~columns["completed"]
+    open_mask &= ~np.isin(keys, keys[columns["completed"]])
+    _, first_index = np.unique(keys[open_mask], return_index=True)
+    started = columns["started"][open_mask][first_index]
+
+    ages = (today - started).astype(int)
+    counts, _ = np.histogram(ages, bins=AGE_BUCKETS + [np.iinfo(np.int64).max])
+    return dict(zip(AGE_LABELS, counts.tolist()))
+
+
+def plot_stats(
+    cycle_times: Dict[str, list], throughput: Dict[str, int], output_file: str
+) -> None:
+    """
+    Save a chart of weekly throughput and median cycle time per tag.
+    """
+    try:
+        import matplotlib.pyplot as plt
+    except ImportError:
+        print("matplotlib is required for --chart. Install it with pip first.")
+        return
+
+    fig, (ax_weeks, ax_tags) = plt.subplots(1, 2, figsize=(15, 6))
+
+    ax_weeks.bar(list(throughput), list(throughput.values()), color="skyblue")
+    ax_weeks.set_title("Completed Tasks per Week", fontsize=16)
+    ax_weeks.tick_params(axis="x", rotation=90, labelsize=8)
+
+    tags = list(cycle_times)
+    ax_tags.barh(tags, [cycle_times[tag][1] for tag in tags], color="skyblue")
+    ax_tags.set_title("Median Cycle Time (days)", fontsize=16)
+
+    plt.tight_layout()
+    plt.savefig(output_file, dpi=300)
+    print(f"Chart saved as {output_file}")
+
+
+def merge_task_columns(
+    columns_list: List[Dict[str, "np.ndarray"]]
+) -> Dict[str, "np.ndarray"]:
+    """
+    Concatenate the task columns of several notebooks.
+    """
+    return {
+        name: np.concatenate([columns[name] for columns in columns_list])
+        for name in COLUMNS
+    }
+
+
+def require_numpy() -> bool:
+    """
+    Return True if numpy is installed, otherwise explain how to get it.
+    """
+    if np is None:
+        print("numpy is required for --stats. Install it with `pip install numpy`.")
+        return False
+    return True
+
+
+def print_stats(
+    chart_file: Optional[str] = None, columns: Optional[Dict] = None
+) -> None:
+    """
+    Print cycle-time percentiles per tag, weekly throughput and the age
+    distribution of open tasks across all history.
+    columns can be passed in to report on already loaded (e.g. merged) data.
+    """
+    if not require_numpy():
+        return
+
+    if columns is None:
+        columns = load_task_columns()
+    if not len(columns["tag"]):
+        print("No tasks found.")
+        return
+
+    today = np.datetime64(get_now().date(), "D")
+    cycle_times = cycle_time_percentiles(columns)
+    throughput = weekly_throughput(columns, today, THROUGHPUT_WEEKS)
+    ages = open_task_ages(columns, today)
+
+    output: List[str] = ["\nCycle time in days by tag:\n"]
+    output.append(f"{'tag':<16} {'count':>6} {'p50':>7} {'p75':>7} {'p90':>7}")
+    for tag, (count, p50, p75, p90) in cycle_times.items():
+        output.append(f"{tag:<16} {count:>6} {p50:>7.1f} {p75:>7.1f} {p90:>7.1f}")
+
+    output.append(f"\nCompleted per week (last {THROUGHPUT_WEEKS} weeks):\n")
+    for week, count in throughput.items():
+        output.append(f"{week}  {count:>4}  {'#' * count}")
+
+    output.append("\nOpen task ages:\n")
+    pad_char = "."
+    for label, count in ages.items():
+        output.append(f"{label:{pad_char}<16} {count}")
+    print("\n".join(output))
+
+    if chart_file:
+        plot_stats(cycle_times, throughput, chart_file)
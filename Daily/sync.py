@@ -1,9 +1,14 @@
 import os
-import re
 
-from json_handler import save_json
+from archive import (
+    get_archive_path,
+    is_year_archived,
+    load_archived_json,
+    write_archive,
+)
+from json_handler import get_notes_path, load_json, save_json
 from parsing import parse_markdown
-from date_paths import BASE_DIR
+from date_paths import BASE_DIR, get_month_json_paths, get_month_md_paths, get_now
 
 
 def sync_json(file_path):
@@ -15,7 +20,7 @@ def sync_json(file_path):
         print(f"Warning: No tasks found in {file_path}. JSON will still be updated.")
 
     json_path = file_path.replace(".md", ".json")
-    save_json(json_path, json_data)
+    save_json(json_path, json_data, with_notes=True)
 
 
 def sync_year(year: int):
@@ -28,12 +33,11 @@ def sync_year(year: int):
         print(f"Warning: No directory found for {year}. Create it first.")
         return
 
-    md_pattern = re.compile(rf"^{year}_(0[1-9]|1[0-2])_[a-z]{{3}}\.md$")
-    md_files = [
-        os.path.join(year_folder, f)
-        for f in os.listdir(year_folder)
-        if md_pattern.match(f)
-    ]
+    if is_year_archived(year_folder):
+        print(f"{year} has been archived. Nothing to sync.")
+        return
+
+    md_files = get_month_md_paths(f"{year}-01", f"{year}-12")
     if not md_files:
         print(f"No Markdown files found in {year_folder}. Nothing to sync.")
         return
@@ -42,3 +46,67 @@ def sync_year(year: int):
         sync_json(file_path)
 
     print(f"Synced {len(md_files)} Markdown files for {year}.")
+
+
+def archive_year(year: int) -> None:
+    """
+    Pack a finished year's month files into a single compressed archive
+    and remove the originals once the archive reads back correctly.
+    """
+    year_folder = os.path.join(BASE_DIR, str(year))
+
+    if year >= get_now().year:
+        print(f"Only finished years can be archived, {year} is not over yet.")
+        return
+    if not os.path.exists(year_folder):
+        print(f"Warning: No directory found for {year}. Nothing to archive.")
+        return
+    if is_year_archived(year_folder):
+        print(f"{year} has already been archived.")
+        return
+
+    json_files = get_month_json_paths(f"{year}-01", f"{year}-12")
+    if not json_files:
+        print(f"No JSON files found in {year_folder}. Nothing to archive.")
+        return
+
+    months = {}
+    original_files = []
+    for json_path in json_files:
+        md_path = json_path.replace(".json", ".md")
+        markdown = ""
+        if os.path.exists(md_path):
+            with open(md_path, "r") as file:
+                markdown = file.read()
+            original_files.append(md_path)
+        original_files.append(json_path)
+        if os.path.exists(get_notes_path(json_path)):
+            original_files.append(get_notes_path(json_path))
+
+        stem = os.path.splitext(os.path.basename(json_path))[0]
+        months[stem[5:7]] = {
+            "stem": stem,
+            "data": load_json(json_path, with_notes=True),
+            "markdown": markdown,
+        }
+
+    archive_path = get_archive_path(year_folder)
+    write_archive(archive_path, months)
+
+    for month in months.values():
+        json_path = os.path.join(year_folder, f"{month['stem']}.json")
+        if load_archived_json(json_path) != month["data"]:
+            os.remove(archive_path)
+            print(f"ERROR: Archive for {year} did not read back correctly. Aborting.")
+            return
+
+    original_size = sum(os.path.getsize(path) for path in original_files)
+    for path in original_files:
+        os.remove(path)
+
+    archive_size = os.path.getsize(archive_path)
+    print(
+        f"Archived {len(months)} months of {year}: "
+        f"{original_size / 1024:.1f} KB in {len(original_files)} files -> "
+        f"{archive_size / 1024:.1f} KB in 1 file."
+    )
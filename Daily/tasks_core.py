@@ -2,9 +2,10 @@ import os
 import re
 from typing import Dict, List
 
+from archive import is_month_archived
 from tasks_printers import print_unfinished_tasks
 from parsing import write_markdown
-from json_handler import load_json, save_json
+from json_handler import append_note, has_inline_notes, load_json, save_json
 from date_paths import (
     get_current_date,
     get_current_date_day,
@@ -37,7 +38,7 @@ def add_task(task_name: str) -> None:
     json_path = get_json_file_path()
     file_path = get_file_path()
     date = get_current_date()
-    data = load_json(json_path)
+    data = load_json(json_path, with_notes=True)
     day = create_new_day(data, date)
 
     # Extract tag if the task starts with backticks.
@@ -75,22 +76,27 @@ def prompt_for_task() -> None:
 
 def add_note(new_note: str) -> None:
     """
-    Add a new note under today's '### Notes' section as a single text block.
+    Add a new note under today's '### Notes' section.
+    The note is appended to the month's notes file as its own record.
     """
     json_path = get_json_file_path()
     file_path = get_file_path()
-    data = load_json(json_path)
+    data = load_json(json_path, with_notes=True)
     today = get_current_date_day()  # e.g., "YYYY-MM-DD"
 
+    day_count = len(data.setdefault("entries", []))
     day = create_new_day(data, today)
+    # The JSON only changes for a new day or inline notes that need moving out
+    if len(data["entries"]) != day_count or has_inline_notes(json_path):
+        save_json(json_path, data)
+    append_note(json_path, today, new_note)
 
     # Append the new note to the existing notes, ensuring a blank line between notes.
-    if day["notes"]:
+    if day.get("notes"):
         day["notes"] += f"\n\n{new_note}"
     else:
         day["notes"] = new_note
 
-    save_json(json_path, data)
     write_markdown(file_path, data)
     print(f"Added note: {new_note[:32]}...")
 
@@ -114,7 +120,7 @@ def check_off_task(task_number: int) -> None:
     """
     json_path = get_json_file_path()
     file_path = get_file_path()
-    data = load_json(json_path)
+    data = load_json(json_path, with_notes=True)
     entries = data.get("entries", [])
 
     current_task_count = 0
@@ -183,12 +189,12 @@ def move_unchecked() -> None:
     Move all unfinished tasks from the current and previous month to today's date.
     """
 
-    def safe_load_json(path):
+    def safe_load_json(path, with_notes=False):
         """
         Load JSON safely, returning a dict with 'entries' key.
         """
-        if path and os.path.exists(path):
-            return load_json(path)
+        if path and (os.path.exists(path) or is_month_archived(path)):
+            return load_json(path, with_notes)
         print(f"Warning: JSON file not found: {path}")
         return {"entries": []}
 
@@ -196,7 +202,7 @@ def move_unchecked() -> None:
     file_path = get_file_path()
     current_json_path = get_json_file_path()
     prev_json_path = get_prev_json_file_path()
-    current_data = safe_load_json(current_json_path)
+    current_data = safe_load_json(current_json_path, with_notes=True)
     prev_data = safe_load_json(prev_json_path)
     current_unfinished = load_unfinished_tasks_from_data(current_data)
     prev_unfinished = load_unfinished_tasks_from_data(prev_data)
@@ -217,7 +223,8 @@ def move_unchecked() -> None:
     remove_unfinished_from_previous_days(current_data, today)
 
     save_json(current_json_path, current_data)
-    if prev_data["entries"]:  # Only save if there were previous entries
+    # Only save if there were previous entries; archived months are read-only
+    if prev_data["entries"] and os.path.exists(prev_json_path):
         save_json(prev_json_path, prev_data)
     write_markdown(file_path, current_data)
     print(f"Moved {len(unique_tasks)} unfinished tasks to today.")
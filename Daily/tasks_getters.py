@@ -5,11 +5,11 @@ from date_paths import get_json_file_path
 from json_handler import load_json
 
 
-def get_unfinished_tasks() -> List[Tuple[int, str, str, str]]:
+def get_unfinished_tasks(json_path: str = None) -> List[Tuple[int, str, str, str]]:
     """
     Retrieve all unfinished tasks from the current months JSON file.
     """
-    data = load_json(get_json_file_path())
+    data = load_json(json_path or get_json_file_path())
     entries = data.get("entries", [])
     unfinished_tasks = []
     task_count = 1
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+
+################################################################################
+# notes_backup.py
+#
+# Description:
+#   Incremental, content-addressed backup of the Notes tree. Files are split
+#   into chunks at content-defined boundaries (gear rolling hash) and each
+#   chunk is stored once under its SHA-256 in the target directory. A run
+#   only copies chunks the target does not already have, so backing up years
+#   of notes after a day's edits writes a few kilobytes.
+#
+# Usage:
+#   ./notes_backup.py backup TARGET [--source DIR]
+#   ./notes_backup.py restore TARGET DEST [--snapshot NAME]
+#   ./notes_backup.py verify TARGET [--snapshot NAME]
+#   ./notes_backup.py list TARGET
+#
+# Options:
+#   --source DIR      Directory to back up (default: ~/Notes).
+#   --snapshot NAME   Snapshot to restore or verify (default: the latest).
+#   --workers N       Processes used for restore and verify (default: CPU count).
+#
+# Notes:
+#   - TARGET is a local path, e.g. a mounted NAS share.
+#   - Layout of TARGET:
+#       chunks/ab/abcdef...   chunk contents named by their SHA-256
+#       snapshots/NAME.json   file list with the chunk hashes of every file
+#   - Files whose size and mtime match the previous snapshot are not read.
+#   - The target itself (if it lies inside the source) and files Daily can
+#     regenerate (.cache directories, .completion) are skipped.
+#
+################################################################################
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+MIN_CHUNK = 2 * 1024
+MAX_CHUNK = 64 * 1024
+# A boundary is cut when the low bits of the rolling hash are zero, giving
+# an average chunk size of about 8KB.
+BOUNDARY_MASK = (1 << 13) - 1
+HASH_MASK = (1 << 64) - 1
+
+# Fixed table so the same content always produces the same boundaries.
+_gear_rng = random.Random(0x6E6F746573)
+GEAR = [_gear_rng.getrandbits(64) for _ in range(256)]
+
+# Regenerable files Daily keeps next to the notes.
+SKIP_DIRS = {".cache"}
+SKIP_FILES = {".completion", ".completion.tmp"}
+
+
+def chunk_boundaries(data: bytes) -> Iterator[Tuple[int, int]]:
+    """
+    Yield (start, end) offsets of the content-defined chunks of data.
+    """
+    start = 0
+    length = len(data)
+
+    while start < length:
+        end = min(start + MAX_CHUNK, length)
+        position = start + MIN_CHUNK
+        rolling = 0
+
+        while position < end:
+            rolling = ((rolling << 1) + GEAR[data[position]]) & HASH_MASK
+            position += 1
+            if not rolling & BOUNDARY_MASK:
+                end = position
+                break
+
+        yield start, end
+        start = end
+
+
+def chunk_path(target: str, digest: str) -> str:
+    return os.path.join(target, "chunks", digest[:2], digest)
+
+
+def store_chunks(target: str, data: bytes) -> Tuple[List[str], int]:
+    """
+    Store the chunks of data that the target does not have yet.
+    Return the chunk hashes and the number of bytes written.
+    """
+    hashes = []
+    written = 0
+
+    for start, end in chunk_boundaries(data):
+        chunk = data[start:end]
+        digest = hashlib.sha256(chunk).hexdigest()
+        hashes.append(digest)
+
+        path = chunk_path(target, digest)
+        if os.path.exists(path):
+            continue
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as file:
+            file.write(chunk)
+        os.replace(tmp_path, path)
+        written += len(chunk)
+
+    return hashes, written
+
+
+def list_snapshots(target: str) -> List[str]:
+    snapshot_dir = os.path.join(target, "snapshots")
+    if not os.path.isdir(snapshot_dir):
+        return []
+    return sorted(f[:-5] for f in os.listdir(snapshot_dir) if f.endswith(".json"))
+
+
+def load_snapshot(target: str, name: Optional[str] = None) -> Optional[Dict]:
+    """
+    Load the named snapshot, or the latest one if no name is given.
+    """
+    snapshots = list_snapshots(target)
+    if not snapshots:
+        return None
+    name = name or snapshots[-1]
+    path = os.path.join(target, "snapshots", f"{name}.json")
+    if not os.path.exists(path):
+        return None
+    with open(path, "r") as file:
+        return json.load(file)
+
+
+def backup(source: str, target: str) -> None:
+    """
+    Back up every file under source into target as a new snapshot.
+    """
+    previous = load_snapshot(target) or {"files": {}}
+    files: Dict[str, Dict] = {}
+    changed = 0
+    written = 0
+    real_target = os.path.realpath(target)
+
+    for root, dirs, names in os.walk(source):
+        dirs[:] = sorted(
+            name
+            for name in dirs
+            if name not in SKIP_DIRS
+            and os.path.realpath(os.path.join(root, name)) != real_target
+        )
+        for name in sorted(names):
+            path = os.path.join(root, name)
+            if name in SKIP_FILES or not os.path.isfile(path):
+                continue
+            rel_path = os.path.relpath(path, source)
+            stat = os.stat(path)
+
+            old = previous["files"].get(rel_path)
+            if (
+                old
+                and old["size"] == stat.st_size
+                and old["mtime_ns"] == stat.st_mtime_ns
+            ):
+                files[rel_path] = old
+                continue
+
+            with open(path, "rb") as file:
+                hashes, file_written = store_chunks(target, file.read())
+            files[rel_path] = {
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "chunks": hashes,
+            }
+            changed += 1
+            written += file_written
+
+    name = datetime.now().strftime("%Y%m%d-%H%M%S")
+    snapshot_dir = os.path.join(target, "snapshots")
+    os.makedirs(snapshot_dir, exist_ok=True)
+    with open(os.path.join(snapshot_dir, f"{name}.json"), "w") as file:
+        json.dump({"source": source, "created": name, "files": files}, file, indent=4)
+
+    print(f"Snapshot {name}: {len(files)} files, {changed} changed.")
+    print(f"Wrote {written / 1024:.1f} KB of new chunks.")
+
+
+def restore_file(target: str, dest: str, rel_path: str, entry: Dict) -> Optional[str]:
+    """
+    Rebuild one file from its chunks. Return an error message on failure.
+    """
+    parts = []
+    for digest in entry["chunks"]:
+        try:
+            with open(chunk_path(target, digest), "rb") as file:
+                chunk = file.read()
+        except OSError:
+            return f"{rel_path}: missing chunk {digest}"
+        if hashlib.sha256(chunk).hexdigest() != digest:
+            return f"{rel_path}: corrupt chunk {digest}"
+        parts.append(chunk)
+
+    path = os.path.join(dest, rel_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as file:
+        file.write(b"".join(parts))
+    os.utime(path, ns=(entry["mtime_ns"], entry["mtime_ns"]))
+    return None
+
+
+def verify_chunk(target: str, digest: str) -> Optional[str]:
+    """
+    Rehash one stored chunk. Return an error message on failure.
+    """
+    try:
+        with open(chunk_path(target, digest), "rb") as file:
+            chunk = file.read()
+    except OSError:
+        return f"missing chunk {digest}"
+    if hashlib.sha256(chunk).hexdigest() != digest:
+        return f"corrupt chunk {digest}"
+    return None
+
+
+def restore(
+    target: str, dest: str, name: Optional[str], workers: Optional[int]
+) -> bool:
+    """
+    Restore a snapshot into dest, rebuilding files in a process pool.
+    """
+    snapshot = load_snapshot(target, name)
+    if snapshot is None:
+        print(f"No snapshot found in {target}.")
+        return False
+
+    items = list(snapshot["files"].items())
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        errors = [
+            error
+            for error in executor.map(
+                restore_file,
+                [target] * len(items),
+                [dest] * len(items),
+                [rel_path for rel_path, _ in items],
+                [entry for _, entry in items],
+                chunksize=16,
+            )
+            if error
+        ]
+
+    for error in errors:
+        print(f"ERROR: {error}")
+    print(f"Restored {len(items) - len(errors)} of {len(items)} files to {dest}.")
+    return not errors
+
+
+def verify(target: str, name: Optional[str], workers: Optional[int]) -> bool:
+    """
+    Check that every chunk referenced by a snapshot exists and is intact.
+    """
+    snapshot = load_snapshot(target, name)
+    if snapshot is None:
+        print(f"No snapshot found in {target}.")
+        return False
+
+    digests = sorted(
+        {digest for entry in snapshot["files"].values() for digest in entry["chunks"]}
+    )
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        errors = [
+            error
+            for error in executor.map(
+                verify_chunk, [target] * len(digests), digests, chunksize=64
+            )
+            if error
+        ]
+
+    for error in errors:
+        print(f"ERROR: {error}")
+    print(f"Verified {len(digests)} chunks: {len(errors)} problems.")
+    return not errors
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Back up the Notes tree.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    backup_parser = subparsers.add_parser("backup", help="Create a new snapshot")
+    backup_parser.add_argument("target")
+    backup_parser.add_argument("--source", default=os.path.expanduser("~/Notes"))
+
+    restore_parser = subparsers.add_parser("restore", help="Restore a snapshot")
+    restore_parser.add_argument("target")
+    restore_parser.add_argument("dest")
+    restore_parser.add_argument("--snapshot")
+    restore_parser.add_argument("--workers", type=int)
+
+    verify_parser = subparsers.add_parser("verify", help="Check stored chunks")
+    verify_parser.add_argument("target")
+    verify_parser.add_argument("--snapshot")
+    verify_parser.add_argument("--workers", type=int)
+
+    list_parser = subparsers.add_parser("list", help="List snapshots")
+    list_parser.add_argument("target")
+
+    args = parser.parse_args()
+
+    if args.command == "backup":
+        backup(os.path.expanduser(args.source), args.target)
+    elif args.command == "restore":
+        ok = restore(args.target, args.dest, args.snapshot, args.workers)
+        sys.exit(0 if ok else 1)
+    elif args.command == "verify":
+        sys.exit(0 if verify(args.target, args.snapshot, args.workers) else 1)
+    elif args.command == "list":
+        for name in list_snapshots(args.target):
+            print(name)